@@ -18,11 +18,16 @@ Environment Variables:
   PHOENIX_EXPORT_DIR: Directory to save exported data (default: "phoenix_export").
 """
 
+import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+import httpx
 from dotenv import load_dotenv
 
 # Import exporters
@@ -33,6 +38,7 @@ from exporters import (
     export_prompts,
     export_traces,
 )
+from exporters.utils import get_projects, save_json
 from utils import create_client_with_retry, parse_export_args
 
 # Configure logging
@@ -48,6 +54,294 @@ load_dotenv()
 RESULTS_DIR = Path("./results")
 RESULTS_DIR.mkdir(exist_ok=True)
 
+# Export results file for each data type
+RESULT_FILES = {
+    name: RESULTS_DIR / f"{name}_export_results.ndjson"
+    for name in ("dataset", "prompt", "trace", "annotation", "evaluation")
+}
+
+
+@dataclass(frozen=True)
+class ExportPaths:
+    """Output directories for one export run, kept as the strings the exporters take."""
+
+    datasets: str
+    prompts: str
+    projects: str
+
+    @classmethod
+    def from_base_dir(cls, base_export_dir: Path) -> "ExportPaths":
+        """Build the output directories under the base export directory."""
+        return cls(
+            datasets=str(base_export_dir / "datasets"),
+            prompts=str(base_export_dir / "prompts"),
+            projects=str(base_export_dir / "projects"),
+        )
+
+
+def _run_datasets(client: httpx.Client, paths: ExportPaths, args: argparse.Namespace) -> bool:
+    """
+    Export datasets (step 1).
+
+    Args:
+        client: HTTPX client
+        paths: Output directories for the export
+        args: Command line arguments
+
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info("Step 1: Exporting datasets...")
+    results_file = str(RESULT_FILES["dataset"])
+
+    try:
+        results = export_datasets.export_datasets(
+            client=client,
+            output_dir=paths.datasets,
+            verbose=args.verbose,
+            results_file=results_file,
+            max_workers=args.workers,
+        )
+
+        if results:
+            export_count = sum(d.get("status") == "exported" for d in results)
+            logger.info("Successfully exported %s datasets", export_count)
+            return True
+        else:
+            logger.error("Failed to export datasets")
+            return False
+    except Exception as e:
+        logger.error("Error exporting datasets: %s", e)
+        return False
+
+
+def _run_prompts(client: httpx.Client, paths: ExportPaths, args: argparse.Namespace) -> bool:
+    """
+    Export prompts (step 2).
+
+    Args:
+        client: HTTPX client
+        paths: Output directories for the export
+        args: Command line arguments
+
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info("Step 2: Exporting prompts...")
+    results_file = str(RESULT_FILES["prompt"])
+
+    try:
+        results = export_prompts.export_prompts(
+            client=client,
+            output_dir=paths.prompts,
+            verbose=args.verbose,
+            results_file=results_file,
+        )
+
+        if results:
+            export_count = sum(p.get("status") == "exported" for p in results)
+            logger.info("Successfully exported %s prompts", export_count)
+            return True
+        else:
+            logger.error("Failed to export prompts")
+            return False
+    except Exception as e:
+        logger.error("Error exporting prompts: %s", e)
+        return False
+
+
+def _prefetch_projects(client: httpx.Client, projects_dir: str) -> Optional[List[Dict]]:
+    """
+    Fetch the project list once for all project-scoped export steps.
+
+    The list is saved to projects.json in the projects directory.
+
+    Args:
+        client: HTTPX client
+        projects_dir: Directory for per-project data
+
+    Returns:
+        List of projects, or None if it could not be fetched (each step then lists the
+        projects itself)
+    """
+    try:
+        projects = get_projects(client)
+        save_json(projects, os.path.join(projects_dir, "projects.json"))
+        logger.info("Found %s projects", len(projects))
+        return projects
+    except Exception as e:
+        logger.error("Error fetching list of projects: %s", e)
+        return None
+
+
+def _summarize_project_results(results: Dict[str, Dict], count_key: str) -> Tuple[int, int]:
+    """
+    Count exported projects and total exported items in a single pass.
+
+    Args:
+        results: Per-project export statuses keyed by project name
+        count_key: Status field holding the number of items exported for a project
+
+    Returns:
+        Tuple of (projects exported successfully, total items exported)
+    """
+    success_count = total = 0
+    for status in results.values():
+        if status.get("status") == "exported":
+            success_count += 1
+        total += status.get(count_key, 0)
+    return success_count, total
+
+
+def _run_traces(
+    client: httpx.Client,
+    paths: ExportPaths,
+    args: argparse.Namespace,
+    projects: Optional[List[Dict]] = None,
+) -> bool:
+    """
+    Export traces and project metadata (step 3).
+
+    Args:
+        client: HTTPX client
+        paths: Output directories for the export
+        args: Command line arguments
+        projects: Project list fetched once for all project steps (optional)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info("Step 3: Exporting traces and project metadata...")
+    results_file = str(RESULT_FILES["trace"])
+
+    try:
+        results = export_traces.export_traces(
+            client=client,
+            output_dir=paths.projects,
+            project_names=args.project,
+            verbose=args.verbose,
+            results_file=results_file,
+            max_workers=args.workers,
+            compress=not args.no_compress,
+            projects=projects,
+        )
+
+        if results:
+            success_count, total_traces = _summarize_project_results(results, "trace_count")
+
+            logger.info(
+                "Successfully exported %s traces from %s projects", total_traces, success_count
+            )
+            return True
+        else:
+            logger.error("Failed to export traces")
+            return False
+    except Exception as e:
+        logger.error("Error exporting traces: %s", e)
+        return False
+
+
+def _run_annotations(
+    client: httpx.Client,
+    paths: ExportPaths,
+    args: argparse.Namespace,
+    projects: Optional[List[Dict]] = None,
+) -> bool:
+    """
+    Export annotations (step 4).
+
+    Args:
+        client: HTTPX client
+        paths: Output directories for the export
+        args: Command line arguments
+        projects: Project list fetched once for all project steps (optional)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info("Step 4: Exporting annotations...")
+    results_file = str(RESULT_FILES["annotation"])
+
+    try:
+        results = export_annotations.export_annotations(
+            client=client,
+            output_dir=paths.projects,
+            project_names=args.project,
+            verbose=args.verbose,
+            results_file=results_file,
+            max_workers=args.workers,
+            projects=projects,
+        )
+
+        if results:
+            success_count, total_annotations = _summarize_project_results(
+                results, "annotation_count"
+            )
+
+            logger.info(
+                "Successfully exported %s annotations from %s projects",
+                total_annotations,
+                success_count,
+            )
+            return True
+        else:
+            logger.error("No annotations were exported")
+            return False
+    except Exception as e:
+        logger.error("Error exporting annotations: %s", e)
+        return False
+
+
+def _run_evaluations(
+    client: httpx.Client,
+    paths: ExportPaths,
+    args: argparse.Namespace,
+    projects: Optional[List[Dict]] = None,
+) -> bool:
+    """
+    Export evaluations (step 5).
+
+    Args:
+        client: HTTPX client
+        paths: Output directories for the export
+        args: Command line arguments
+        projects: Project list fetched once for all project steps (optional)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info("Step 5: Exporting evaluations...")
+    results_file = str(RESULT_FILES["evaluation"])
+
+    try:
+        results = export_evaluations.export_evaluations(
+            client=client,
+            output_dir=paths.projects,
+            project_names=args.project,
+            verbose=args.verbose,
+            results_file=results_file,
+            max_workers=args.workers,
+            projects=projects,
+        )
+
+        if results:
+            success_count, total_evaluations = _summarize_project_results(
+                results, "evaluation_count"
+            )
+
+            logger.info(
+                "Successfully exported %s evaluations from %s projects",
+                total_evaluations,
+                success_count,
+            )
+            return True
+        else:
+            logger.error("Failed to export evaluations")
+            return False
+    except Exception as e:
+        logger.error("Error exporting evaluations: %s", e)
+        return False
+
 
 def main() -> None:
     """Main entry point for the script."""
@@ -66,13 +360,10 @@ def main() -> None:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    if not os.path.isabs(args.export_dir):
-        base_export_dir = args.export_dir
-    else:
-        base_export_dir = args.export_dir
+    base_export_dir = Path(args.export_dir)
 
-    logger.info(f"Connecting to Phoenix server at {args.base_url}")
-    logger.info(f"Exporting data to: {os.path.abspath(base_export_dir)}")
+    logger.info("Connecting to Phoenix server at %s", args.base_url)
+    logger.info("Exporting data to: %s", base_export_dir.absolute())
 
     # Create HTTPX client with retry capabilities
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
@@ -87,12 +378,12 @@ def main() -> None:
         initial_backoff=args.initial_backoff,
         max_backoff=args.max_backoff,
         backoff_factor=args.backoff_factor,
+        # Reuse keep-alive connections across every exporter call (and across the
+        # concurrent export steps) instead of paying a TCP/TLS handshake per request
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
     )
 
-    # Keep track of successful exports
-    successful_exports = []
-    failed_exports = []
-
     # Check if any export type is selected
     if not (
         args.all
@@ -106,169 +397,74 @@ def main() -> None:
         logger.error("No export type selected. Use --help to see available options.")
         return
 
-    # Create the projects directory (needs to exist for annotations even if not exporting traces)
-    projects_dir = os.path.join(base_export_dir, "projects")
-    os.makedirs(projects_dir, exist_ok=True)
-
-    # Export datasets (step 1)
-    if args.all or args.datasets:
-        logger.info("Step 1: Exporting datasets...")
-        datasets_dir = os.path.join(base_export_dir, "datasets")
-        results_file = os.path.join(RESULTS_DIR, "dataset_export_results.json")
-
-        try:
-            results = export_datasets.export_datasets(
-                client=client,
-                output_dir=datasets_dir,
-                verbose=args.verbose,
-                results_file=results_file,
-            )
-
-            if results:
-                export_count = sum(d.get("status") == "exported" for d in results)
-                logger.info(f"Successfully exported {export_count} datasets")
-                successful_exports.append("datasets")
-            else:
-                logger.error("Failed to export datasets")
-                failed_exports.append("datasets")
-        except Exception as e:
-            logger.error(f"Error exporting datasets: {e}")
-            failed_exports.append("datasets")
-
-    # Export prompts (step 2)
-    if args.all or args.prompts:
-        logger.info("Step 2: Exporting prompts...")
-        prompts_dir = os.path.join(base_export_dir, "prompts")
-        results_file = os.path.join(RESULTS_DIR, "prompt_export_results.json")
-
-        try:
-            results = export_prompts.export_prompts(
-                client=client,
-                output_dir=prompts_dir,
-                verbose=args.verbose,
-                results_file=results_file,
-            )
-
-            if results:
-                export_count = sum(p.get("status") == "exported" for p in results)
-                logger.info(f"Successfully exported {export_count} prompts")
-                successful_exports.append("prompts")
-            else:
-                logger.error("Failed to export prompts")
-                failed_exports.append("prompts")
-        except Exception as e:
-            logger.error(f"Error exporting prompts: {e}")
-            failed_exports.append("prompts")
-
-    # Export traces (step 3)
-    if args.all or args.traces or args.projects:
-        logger.info("Step 3: Exporting traces and project metadata...")
-        results_file = os.path.join(RESULTS_DIR, "trace_export_results.json")
-
-        try:
-            results = export_traces.export_traces(
-                client=client,
-                output_dir=projects_dir,
-                project_names=args.project,
-                verbose=args.verbose,
-                results_file=results_file,
-            )
-
-            if results:
-                success_count = sum(
-                    1 for status in results.values() if status.get("status") == "exported"
-                )
-                total_traces = sum(p.get("trace_count", 0) for p in results.values())
-
-                logger.info(
-                    f"Successfully exported {total_traces} traces from {success_count} projects"
-                )
-                successful_exports.append("traces")
-            else:
-                logger.error("Failed to export traces")
-                failed_exports.append("traces")
-        except Exception as e:
-            logger.error(f"Error exporting traces: {e}")
-            failed_exports.append("traces")
-
-    # Export annotations (step 4)
-    if args.all or args.annotations:
-        logger.info("Step 4: Exporting annotations...")
-        results_file = os.path.join(RESULTS_DIR, "annotation_export_results.json")
-
-        try:
-            results = export_annotations.export_annotations(
-                client=client,
-                output_dir=projects_dir,
-                project_names=args.project,
-                verbose=args.verbose,
-                results_file=results_file,
+    # Create the output directories of the selected steps once, before the steps run
+    # concurrently (the projects directory is needed for annotations even without traces)
+    paths = ExportPaths.from_base_dir(base_export_dir)
+    export_project_data = (
+        args.all or args.traces or args.projects or args.annotations or args.evaluations
+    )
+    for selected, directory in (
+        (args.all or args.datasets, paths.datasets),
+        (args.all or args.prompts, paths.prompts),
+        (export_project_data, paths.projects),
+    ):
+        if selected:
+            os.makedirs(directory, exist_ok=True)
+
+    # List the projects once for steps 3-5 instead of once per step
+    projects = None
+    if export_project_data and args.project is None:
+        projects = _prefetch_projects(client, paths.projects)
+
+    # Export steps are network-bound, so independent steps share the (thread-safe) client
+    # and run concurrently. Datasets, prompts and traces (steps 1-3) have no ordering
+    # dependency; annotations and evaluations (steps 4-5) start once traces are done.
+    futures = {}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        if args.all or args.datasets:
+            futures["datasets"] = executor.submit(_run_datasets, client, paths, args)
+        if args.all or args.prompts:
+            futures["prompts"] = executor.submit(_run_prompts, client, paths, args)
+        if args.all or args.traces or args.projects:
+            futures["traces"] = executor.submit(_run_traces, client, paths, args, projects)
+            # Wait for traces so the project directories are populated before step 4
+            futures["traces"].result()
+
+        if args.all or args.annotations:
+            futures["annotations"] = executor.submit(
+                _run_annotations, client, paths, args, projects
             )
-
-            if results:
-                success_count = sum(
-                    1 for status in results.values() if status.get("status") == "exported"
-                )
-                total_annotations = sum(p.get("annotation_count", 0) for p in results.values())
-
-                logger.info(
-                    f"Successfully exported {total_annotations} annotations "
-                    f"from {success_count} projects"
-                )
-                successful_exports.append("annotations")
-            else:
-                logger.error("No annotations were exported")
-                failed_exports.append("annotations")
-        except Exception as e:
-            logger.error(f"Error exporting annotations: {e}")
-            failed_exports.append("annotations")
-
-    # Export evaluations (step 5)
-    if args.all or args.evaluations:
-        logger.info("Step 5: Exporting evaluations...")
-        results_file = os.path.join(RESULTS_DIR, "evaluation_export_results.json")
-
-        try:
-            results = export_evaluations.export_evaluations(
-                client=client,
-                output_dir=projects_dir,
-                project_names=args.project,
-                verbose=args.verbose,
-                results_file=results_file,
+        if args.all or args.evaluations:
+            futures["evaluations"] = executor.submit(
+                _run_evaluations, client, paths, args, projects
             )
 
-            if results:
-                success_count = sum(
-                    1 for status in results.values() if status.get("status") == "exported"
-                )
-                total_evaluations = sum(p.get("evaluation_count", 0) for p in results.values())
-
-                logger.info(
-                    f"Successfully exported {total_evaluations} evaluations "
-                    f"from {success_count} projects"
-                )
-                successful_exports.append("evaluations")
-            else:
-                logger.error("Failed to export evaluations")
-                failed_exports.append("evaluations")
-        except Exception as e:
-            logger.error(f"Error exporting evaluations: {e}")
-            failed_exports.append("evaluations")
+    # Keep track of successful exports, in step order
+    successful_exports = []
+    failed_exports = []
+    for step, future in futures.items():
+        if future.result():
+            successful_exports.append(step)
+        else:
+            failed_exports.append(step)
 
     # Print summary
     print("\n=== Export Summary ===")
     if successful_exports:
-        logger.info(f"Successfully exported: {', '.join(successful_exports)}")
+        logger.info("Successfully exported: %s", ", ".join(successful_exports))
 
     if failed_exports:
-        logger.error(f"Failed to export: {', '.join(failed_exports)}")
+        logger.error("Failed to export: %s", ", ".join(failed_exports))
 
     # Display results file locations
     print("\n=== Export Results Files ===")
-    for result_type in ["dataset", "trace", "prompt", "annotation", "evaluation"]:
-        result_file = RESULTS_DIR / f"{result_type}_export_results.json"
-        if result_file.exists():
-            print(f"- {result_type.capitalize()} results: {result_file}")
+    present = {entry.name for entry in os.scandir(RESULTS_DIR)}
+    for result_type, result_file in RESULT_FILES.items():
+        if result_file.name in present:
+            # Results are NDJSON, one record per line
+            with open(result_file, "rb") as f:
+                record_count = sum(1 for _ in f)
+            print(f"- {result_type.capitalize()} results: {result_file} ({record_count} records)")
 
     if failed_exports:
         sys.exit(1)
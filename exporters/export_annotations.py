@@ -30,12 +30,17 @@ API Reference:
 import json
 import logging
 import os
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import httpx
-from tqdm import tqdm
 
-from .utils import get_projects, parse_multipart_response, save_json
+from .utils import (
+    NDJSONWriter,
+    get_projects,
+    map_concurrently,
+    parse_multipart_response,
+    save_json,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -178,7 +183,11 @@ def get_annotations(client: httpx.Client, project_name: str, span_ids: List[str]
 
 
 def export_project_annotations(
-    client: httpx.Client, project_name: str, output_dir: str, verbose: bool = False
+    client: httpx.Client,
+    project_name: str,
+    output_dir: str,
+    verbose: bool = False,
+    max_workers: int = 4,
 ) -> Dict[str, Union[str, int]]:
     """
     Export annotations for a specific project.
@@ -188,6 +197,7 @@ def export_project_annotations(
         project_name: Name of the project
         output_dir: Directory to save the exported data
         verbose: Whether to enable verbose output
+        max_workers: Maximum number of annotation batches fetched concurrently
 
     Returns:
         Dictionary with export results
@@ -222,27 +232,34 @@ def export_project_annotations(
         logger.info(f"Found {len(span_ids)} unique span IDs in traces for project {project_name}")
 
         # Get annotations for these spans in batches to avoid URL length limitations
-        all_annotations = []
         batch_size = 10  # The API can only handle 10 span_ids per request
         span_ids_list = list(span_ids)
+        batches = [
+            span_ids_list[i : i + batch_size] for i in range(0, len(span_ids_list), batch_size)
+        ]
 
-        for i in range(0, len(span_ids_list), batch_size):
-            batch = span_ids_list[i : i + batch_size]
-
+        def fetch_batch(numbered_batch: Tuple[int, List[str]]) -> List[Dict]:
+            batch_num, batch = numbered_batch
             try:
-                batch_num = i // batch_size + 1
-                total_batches = (len(span_ids_list) + batch_size - 1) // batch_size
-                logger.info(f"Fetching annotations for batch {batch_num}/{total_batches}...")
+                logger.info("Fetching annotations for batch %s/%s...", batch_num, len(batches))
                 batch_annotations = get_annotations(client, project_name, batch)
-                all_annotations.extend(batch_annotations)
 
                 if verbose:
-                    logger.debug(f"Retrieved {len(batch_annotations)} annotations in this batch")
+                    logger.debug("Retrieved %s annotations in this batch", len(batch_annotations))
+
+                return batch_annotations
 
             except Exception as e:
-                logger.error(f"Error fetching annotations for batch of span IDs: {e}")
+                logger.error("Error fetching annotations for batch of span IDs: %s", e)
                 # Continue with next batch instead of failing entirely
-                continue
+                return []
+
+        # Batches are small independent requests, so they are fetched concurrently
+        all_annotations = []
+        for batch_annotations in map_concurrently(
+            fetch_batch, list(enumerate(batches, start=1)), max_workers=max_workers
+        ):
+            all_annotations.extend(batch_annotations)
 
         # Filter out evaluation annotations (LLM and code annotation_kind)
         # These represent evaluations and should be exported separately
@@ -288,6 +305,8 @@ def export_annotations(
     project_names: Optional[List[str]] = None,
     verbose: bool = False,
     results_file: Optional[str] = None,
+    max_workers: int = 4,
+    projects: Optional[List[Dict]] = None,
 ) -> Dict[str, Dict]:
     """
     Export annotations for multiple projects.
@@ -298,6 +317,10 @@ def export_annotations(
         project_names: List of project names to export (None for all projects)
         verbose: Whether to enable verbose output
         results_file: Path to save the results JSON
+        max_workers: Maximum number of annotation requests in flight, split between
+            projects and the annotation batches within each project
+        projects: Project list already fetched from the server (fetched if None and
+            project_names is None)
 
     Returns:
         Dictionary with export results for each project
@@ -308,12 +331,14 @@ def export_annotations(
         logger.setLevel(logging.DEBUG)
 
     results = {}
+    results_writer = NDJSONWriter(results_file)
 
     try:
         # Get all projects if project_names is None
         if project_names is None:
-            logger.info("Fetching list of projects...")
-            projects = get_projects(client)
+            if projects is None:
+                logger.info("Fetching list of projects...")
+                projects = get_projects(client)
             project_names = [p["name"] for p in projects]
 
         if not project_names:
@@ -322,26 +347,38 @@ def export_annotations(
 
         logger.info(f"Found {len(project_names)} projects to export annotations for")
 
-        # Export annotations for each project
-        for project_name in tqdm(project_names, desc="Exporting annotations"):
-            results[project_name] = export_project_annotations(
-                client=client, project_name=project_name, output_dir=output_dir, verbose=verbose
-            )
+        # Export annotations for each project concurrently. Projects and each project's
+        # batches share one max_workers budget, so requests in flight never exceed it
+        project_workers = max(1, min(max_workers, len(project_names)))
+        batch_workers = max(1, max_workers // project_workers)
+        statuses = map_concurrently(
+            lambda project_name: export_project_annotations(
+                client=client,
+                project_name=project_name,
+                output_dir=output_dir,
+                verbose=verbose,
+                max_workers=batch_workers,
+            ),
+            project_names,
+            max_workers=project_workers,
+            on_result=results_writer.write,
+            desc="Exporting annotations",
+        )
+        results = dict(zip(project_names, statuses))
 
         logger.info(f"Annotations export completed successfully. Data saved to {output_dir}")
 
-        # Save results to file if requested
         if results_file:
-            save_json(results, results_file)
             logger.info(f"Export results saved to {results_file}")
 
         return results
 
     except Exception as e:
         logger.error(f"Error during annotations export: {e}")
-        if results_file:
-            save_json({"error": str(e), "projects": results}, results_file)
+        results_writer.write({"error": str(e)})
         return results
+    finally:
+        results_writer.close()
 
 
 if __name__ == "__main__":
@@ -383,8 +420,15 @@ if __name__ == "__main__":
         help="Project name to export annotations for "
         "(can be used multiple times, omit to export all projects)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum annotation requests in flight, split between projects and their "
+        "annotation batches (default: 4)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--results-file", type=str, help="Path to save export results JSON")
+    parser.add_argument("--results-file", type=str, help="Path to save export results (NDJSON)")
 
     args = parser.parse_args()
 
@@ -410,6 +454,7 @@ if __name__ == "__main__":
         project_names=args.projects,  # None if no --projects arguments were provided
         verbose=args.verbose,
         results_file=args.results_file,
+        max_workers=args.workers,
     )
 
     # Print summary
@@ -20,7 +20,7 @@ from typing import Dict, List, Optional
 
 import httpx
 
-from .utils import save_json
+from .utils import NDJSONWriter, map_concurrently, save_json
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +46,53 @@ def get_experiments(client: httpx.Client, dataset_id: str) -> List[Dict]:
     return response.json().get("data", [])
 
 
+def export_dataset(client: httpx.Client, dataset: Dict, output_dir: str) -> Dict:
+    """Export the examples and experiments of a single dataset."""
+    dataset_id = dataset["id"]
+    dataset_name = dataset.get("name", dataset_id)
+
+    dataset_result = {
+        "id": dataset_id,
+        "name": dataset_name,
+        "examples_count": 0,
+        "experiments_count": 0,
+        "status": "exported",
+    }
+
+    try:
+        # Export examples
+        logger.info(f"Exporting examples for dataset {dataset_name} ({dataset_id})...")
+        examples = get_dataset_examples(client, dataset_id)
+        examples_path = os.path.join(output_dir, f"dataset_{dataset_id}_examples.json")
+        save_json(examples, examples_path)
+        dataset_result["examples_count"] = len(examples)
+
+        # Export experiments
+        logger.info(f"Exporting experiments for dataset {dataset_name} ({dataset_id})...")
+        experiments = get_experiments(client, dataset_id)
+        experiments_path = os.path.join(output_dir, f"dataset_{dataset_id}_experiments.json")
+        save_json(experiments, experiments_path)
+        dataset_result["experiments_count"] = len(experiments)
+
+        logger.info(
+            f"Successfully exported dataset {dataset_name} with {len(examples)} examples "
+            f"and {len(experiments)} experiments"
+        )
+
+    except Exception as e:
+        logger.error(f"Error exporting dataset {dataset_name}: {e}")
+        dataset_result["status"] = "error"
+        dataset_result["error"] = str(e)
+
+    return dataset_result
+
+
 def export_datasets(
-    client: httpx.Client, output_dir: str, verbose: bool = False, results_file: Optional[str] = None
+    client: httpx.Client,
+    output_dir: str,
+    verbose: bool = False,
+    results_file: Optional[str] = None,
+    max_workers: int = 4,
 ) -> List[Dict]:
     """Export all datasets and their experiments."""
     os.makedirs(output_dir, exist_ok=True)
@@ -56,6 +101,7 @@ def export_datasets(
         logger.setLevel(logging.DEBUG)
 
     results = []
+    results_writer = NDJSONWriter(results_file)
 
     try:
         # Export datasets and their examples
@@ -69,62 +115,27 @@ def export_datasets(
         logger.info(f"Found {len(datasets)} datasets")
         save_json(datasets, os.path.join(output_dir, "datasets.json"))
 
-        for dataset in datasets:
-            dataset_id = dataset["id"]
-            dataset_name = dataset.get("name", dataset_id)
-
-            dataset_result = {
-                "id": dataset_id,
-                "name": dataset_name,
-                "examples_count": 0,
-                "experiments_count": 0,
-                "status": "exported",
-            }
-
-            try:
-                # Export examples
-                logger.info(f"Exporting examples for dataset {dataset_name} ({dataset_id})...")
-                examples = get_dataset_examples(client, dataset_id)
-                examples_path = os.path.join(output_dir, f"dataset_{dataset_id}_examples.json")
-                save_json(examples, examples_path)
-                dataset_result["examples_count"] = len(examples)
-
-                # Export experiments
-                logger.info(f"Exporting experiments for dataset {dataset_name} ({dataset_id})...")
-                experiments = get_experiments(client, dataset_id)
-                experiments_path = os.path.join(
-                    output_dir, f"dataset_{dataset_id}_experiments.json"
-                )
-                save_json(experiments, experiments_path)
-                dataset_result["experiments_count"] = len(experiments)
-
-                logger.info(
-                    f"Successfully exported dataset {dataset_name} with {len(examples)} examples "
-                    f"and {len(experiments)} experiments"
-                )
-
-            except Exception as e:
-                logger.error(f"Error exporting dataset {dataset_name}: {e}")
-                dataset_result["status"] = "error"
-                dataset_result["error"] = str(e)
-
-            results.append(dataset_result)
+        # Datasets are independent, so their examples and experiments are fetched concurrently
+        results = map_concurrently(
+            lambda dataset: export_dataset(client=client, dataset=dataset, output_dir=output_dir),
+            datasets,
+            max_workers=max_workers,
+            on_result=results_writer.write,
+        )
 
         logger.info(f"Datasets export completed successfully. Data saved to {output_dir}")
 
-        # Save results to file if requested
         if results_file:
-            save_json(results, results_file)
             logger.info(f"Export results saved to {results_file}")
 
         return results
 
     except Exception as e:
         logger.error(f"Error during datasets export: {e}")
-        if results_file:
-            error_results = {"error": str(e), "datasets": results}
-            save_json(error_results, results_file)
+        results_writer.write({"error": str(e)})
         return results
+    finally:
+        results_writer.close()
 
 
 if __name__ == "__main__":
@@ -159,8 +170,14 @@ if __name__ == "__main__":
         default="./phoenix_export/datasets",
         help="Directory to save exported data (default: ./phoenix_export/datasets)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of datasets to export concurrently (default: 4)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--results-file", type=str, help="Path to save export results JSON")
+    parser.add_argument("--results-file", type=str, help="Path to save export results (NDJSON)")
 
     args = parser.parse_args()
 
@@ -184,6 +201,7 @@ if __name__ == "__main__":
         output_dir=args.output_dir,
         verbose=args.verbose,
         results_file=args.results_file,
+        max_workers=args.workers,
     )
 
     # Print summary
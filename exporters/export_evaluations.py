@@ -29,13 +29,12 @@ import os
 from typing import Dict, List, Optional, Union
 
 import httpx
-from tqdm import tqdm
 
 # Handle both direct execution and module import
 try:
-    from .utils import get_projects, save_json
+    from .utils import NDJSONWriter, get_projects, map_concurrently, save_json
 except ImportError:
-    from utils import get_projects, save_json
+    from utils import NDJSONWriter, get_projects, map_concurrently, save_json
 
 # Import pandas for data handling
 try:
@@ -262,9 +261,9 @@ def export_project_evaluations(
                     eval_types[eval_type] = eval_types.get(eval_type, 0) + 1
                     eval_names[eval_name] = eval_names.get(eval_name, 0) + 1
 
-                logger.debug(f"Evaluation breakdown for {project_name}:")
-                logger.debug(f"  By type: {eval_types}")
-                logger.debug(f"  By name: {eval_names}")
+                logger.debug("Evaluation breakdown for %s:", project_name)
+                logger.debug("  By type: %s", eval_types)
+                logger.debug("  By name: %s", eval_names)
         else:
             logger.info(f"No evaluations found for project {project_name}")
 
@@ -283,6 +282,8 @@ def export_evaluations(
     project_names: Optional[List[str]] = None,
     verbose: bool = False,
     results_file: Optional[str] = None,
+    max_workers: int = 4,
+    projects: Optional[List[Dict]] = None,
 ) -> Dict[str, Dict]:
     """
     Export evaluations for multiple projects.
@@ -293,6 +294,9 @@ def export_evaluations(
         project_names: List of project names to export (None for all projects)
         verbose: Whether to enable verbose output
         results_file: Path to save the results JSON
+        max_workers: Maximum number of projects exported concurrently
+        projects: Project list already fetched from the server (fetched if None and
+            project_names is None)
 
     Returns:
         Dictionary with export results for each project
@@ -303,12 +307,14 @@ def export_evaluations(
         logger.setLevel(logging.DEBUG)
 
     results = {}
+    results_writer = NDJSONWriter(results_file)
 
     try:
         # Get all projects if project_names is None
         if project_names is None:
-            logger.info("Fetching list of projects...")
-            projects = get_projects(client)
+            if projects is None:
+                logger.info("Fetching list of projects...")
+                projects = get_projects(client)
             project_names = [p["name"] for p in projects]
 
         if not project_names:
@@ -317,26 +323,31 @@ def export_evaluations(
 
         logger.info(f"Found {len(project_names)} projects to export evaluations for")
 
-        # Export evaluations for each project
-        for project_name in tqdm(project_names, desc="Exporting evaluations"):
-            results[project_name] = export_project_evaluations(
+        # Export evaluations for each project concurrently
+        statuses = map_concurrently(
+            lambda project_name: export_project_evaluations(
                 client=client, project_name=project_name, output_dir=output_dir, verbose=verbose
-            )
+            ),
+            project_names,
+            max_workers=max_workers,
+            on_result=results_writer.write,
+            desc="Exporting evaluations",
+        )
+        results = dict(zip(project_names, statuses))
 
         logger.info(f"Evaluations export completed successfully. Data saved to {output_dir}")
 
-        # Save results to file if requested
         if results_file:
-            save_json(results, results_file)
             logger.info(f"Export results saved to {results_file}")
 
         return results
 
     except Exception as e:
         logger.error(f"Error during evaluations export: {e}")
-        if results_file:
-            save_json({"error": str(e), "projects": results}, results_file)
+        results_writer.write({"error": str(e)})
         return results
+    finally:
+        results_writer.close()
 
 
 if __name__ == "__main__":
@@ -377,8 +388,14 @@ if __name__ == "__main__":
         action="append",
         help="Project name to export evaluations for (can be used multiple times)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of projects to export concurrently (default: 4)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--results-file", type=str, help="Path to save export results JSON")
+    parser.add_argument("--results-file", type=str, help="Path to save export results (NDJSON)")
 
     args = parser.parse_args()
 
@@ -402,6 +419,7 @@ if __name__ == "__main__":
         project_names=args.project,  # None if no --project arguments were provided
         verbose=args.verbose,
         results_file=args.results_file,
+        max_workers=args.workers,
     )
 
     # Print summary
@@ -20,7 +20,7 @@ from typing import Dict, List, Optional
 
 import httpx
 
-from .utils import save_json
+from .utils import NDJSONWriter, save_json
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -43,6 +43,7 @@ def export_prompts(
         logger.setLevel(logging.DEBUG)
 
     results = []
+    results_writer = NDJSONWriter(results_file)
 
     try:
         # Export prompts
@@ -63,22 +64,21 @@ def export_prompts(
 
             prompt_result = {"id": prompt_id, "name": prompt_name, "status": "exported"}
             results.append(prompt_result)
+            results_writer.write(prompt_result)
 
         logger.info(f"Prompts export completed successfully. Data saved to {output_dir}")
 
-        # Save results to file if requested
         if results_file:
-            save_json(results, results_file)
             logger.info(f"Export results saved to {results_file}")
 
         return results
 
     except Exception as e:
         logger.error(f"Error during prompts export: {e}")
-        if results_file:
-            error_results = {"error": str(e), "prompts": results}
-            save_json(error_results, results_file)
+        results_writer.write({"error": str(e)})
         return results
+    finally:
+        results_writer.close()
 
 
 if __name__ == "__main__":
@@ -114,7 +114,7 @@ if __name__ == "__main__":
         help="Directory to save exported data (default: ./phoenix_export/prompts)",
     )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--results-file", type=str, help="Path to save export results JSON")
+    parser.add_argument("--results-file", type=str, help="Path to save export results (NDJSON)")
 
     args = parser.parse_args()
 
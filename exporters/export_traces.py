@@ -32,9 +32,15 @@ import os
 from typing import Dict, List, Optional, Union
 
 import httpx
-from tqdm import tqdm
 
-from .utils import get_projects, parse_multipart_response, save_json
+from .utils import (
+    NDJSONWriter,
+    get_projects,
+    map_concurrently,
+    parse_multipart_response,
+    save_json,
+    save_ndjson_gz,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -93,9 +99,19 @@ def get_traces(client: httpx.Client, project_name: str, limit: int = 1000) -> Li
 
 
 def export_project_traces(
-    client: httpx.Client, project_name: str, output_dir: str, verbose: bool = False
+    client: httpx.Client,
+    project_name: str,
+    output_dir: str,
+    verbose: bool = False,
+    compress: bool = True,
+    project_metadata: Optional[Dict] = None,
 ) -> Dict[str, Union[str, int]]:
-    """Export traces for a specific project."""
+    """Export traces for a specific project.
+
+    Spans are written to traces.ndjson.gz, or to an indented traces.json when compress
+    is False. Metadata already fetched with the project list is saved as-is instead of
+    being requested again.
+    """
     project_dir = os.path.join(output_dir, project_name)
     os.makedirs(project_dir, exist_ok=True)
 
@@ -104,7 +120,10 @@ def export_project_traces(
     try:
         logger.info(f"Exporting project metadata for {project_name}...")
         try:
-            project_metadata = get_project_metadata(client, project_name)
+            if project_metadata is None:
+                project_metadata = get_project_metadata(client, project_name)
+            else:
+                project_metadata = {"data": project_metadata}
             save_json(project_metadata, os.path.join(project_dir, "project_metadata.json"))
         except Exception as e:
             logger.error(f"Error exporting metadata for project {project_name}: {e}")
@@ -112,7 +131,15 @@ def export_project_traces(
         logger.info(f"Exporting traces for {project_name}...")
         try:
             traces = get_traces(client, project_name)
-            save_json(traces, os.path.join(project_dir, "traces.json"))
+            if compress:
+                save_ndjson_gz(traces, os.path.join(project_dir, "traces.ndjson.gz"))
+                stale_file = os.path.join(project_dir, "traces.json")
+            else:
+                save_json(traces, os.path.join(project_dir, "traces.json"))
+                stale_file = os.path.join(project_dir, "traces.ndjson.gz")
+            # Remove the other format left by an earlier export, or importers could pick it up
+            if os.path.exists(stale_file):
+                os.remove(stale_file)
             result["trace_count"] = len(traces)
         except Exception as e:
             logger.error(f"Error exporting traces for project {project_name}: {e}")
@@ -135,45 +162,69 @@ def export_traces(
     project_names: Optional[List[str]] = None,
     verbose: bool = False,
     results_file: Optional[str] = None,
+    max_workers: int = 4,
+    compress: bool = True,
+    projects: Optional[List[Dict]] = None,
 ) -> Dict[str, Dict]:
-    """Export traces for multiple projects."""
+    """Export traces for multiple projects.
+
+    A project list already fetched from the server can be passed as projects to skip
+    listing the projects again.
+    """
     os.makedirs(output_dir, exist_ok=True)
 
     if verbose:
         logger.setLevel(logging.DEBUG)
 
     results = {}
+    results_writer = NDJSONWriter(results_file)
 
     try:
         if project_names is None:
-            logger.info("Fetching list of projects...")
-            projects = get_projects(client)
+            if projects is None:
+                logger.info("Fetching list of projects...")
+                projects = get_projects(client)
             project_names = [p["name"] for p in projects]
 
+        metadata_by_name = {p["name"]: p for p in projects or []}
+
         if not project_names:
             logger.warning("No projects found or provided")
             return results
 
         logger.info(f"Found {len(project_names)} projects to export traces for")
 
-        for project_name in tqdm(project_names, desc="Exporting traces"):
-            results[project_name] = export_project_traces(
-                client=client, project_name=project_name, output_dir=output_dir, verbose=verbose
-            )
+        # Each project is an independent fetch + write, so projects share the client
+        # and are exported concurrently
+        statuses = map_concurrently(
+            lambda project_name: export_project_traces(
+                client=client,
+                project_name=project_name,
+                output_dir=output_dir,
+                verbose=verbose,
+                compress=compress,
+                project_metadata=metadata_by_name.get(project_name),
+            ),
+            project_names,
+            max_workers=max_workers,
+            on_result=results_writer.write,
+            desc="Exporting traces",
+        )
+        results = dict(zip(project_names, statuses))
 
         logger.info(f"Trace export completed successfully. Data saved to {output_dir}")
 
         if results_file:
-            save_json(results, results_file)
             logger.info(f"Export results saved to {results_file}")
 
         return results
 
     except Exception as e:
         logger.error(f"Error during traces export: {e}")
-        if results_file:
-            save_json({"error": str(e), "projects": results}, results_file)
+        results_writer.write({"error": str(e)})
         return results
+    finally:
+        results_writer.close()
 
 
 if __name__ == "__main__":
@@ -213,8 +264,19 @@ if __name__ == "__main__":
         action="append",
         help="Project name to export traces for (can be used multiple times, omit to export all)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of projects to export concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Write traces as indented traces.json instead of traces.ndjson.gz",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    parser.add_argument("--results-file", type=str, help="Path to save export results JSON")
+    parser.add_argument("--results-file", type=str, help="Path to save export results (NDJSON)")
 
     args = parser.parse_args()
 
@@ -236,6 +298,8 @@ if __name__ == "__main__":
         project_names=args.project,
         verbose=args.verbose,
         results_file=args.results_file,
+        max_workers=args.workers,
+        compress=not args.no_compress,
     )
 
     success_count = sum(p.get("status") == "exported" for p in results.values())
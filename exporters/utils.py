@@ -5,19 +5,113 @@ Phoenix Exporters Utility Functions
 Common utility functions used across multiple exporter modules.
 """
 
+import gzip
 import json
 import logging
-from typing import Dict, List, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import httpx
+import orjson
+from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
 
 def save_json(data: Union[Dict, List], filepath: str) -> None:
     """Save data to a JSON file."""
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(filepath, "wb") as f:
+        f.write(
+            orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        )
+
+
+def save_ndjson_gz(records: List[Dict], filepath: str) -> None:
+    """
+    Save records to a gzip-compressed newline-delimited JSON file.
+
+    Records are encoded and compressed one at a time. The fastest compression level is
+    used, since most of the size win on JSON comes from any compression at all.
+    """
+    with gzip.open(filepath, "wb", compresslevel=1) as f:
+        for record in records:
+            f.write(
+                orjson.dumps(
+                    record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+                + b"\n"
+            )
+
+
+class NDJSONWriter:
+    """
+    Write records to a newline-delimited JSON file as they are produced.
+
+    The file is opened on the first write, so nothing is created when there is nothing
+    to record, and each line is flushed so partial results survive an interrupted run.
+    """
+
+    def __init__(self, filepath: Optional[str]) -> None:
+        """
+        Args:
+            filepath: Path of the NDJSON file (records are discarded if None)
+        """
+        self.filepath = filepath
+        self._file = None
+
+    def write(self, record: Dict) -> None:
+        """Append a record as one line."""
+        if not self.filepath:
+            return
+        if self._file is None:
+            self._file = open(self.filepath, "wb")
+        self._file.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the file if it was opened."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def map_concurrently(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    max_workers: int = 1,
+    desc: Optional[str] = None,
+    on_result: Optional[Callable[[Any], None]] = None,
+) -> List[Any]:
+    """
+    Apply a function to each item on a thread pool, preserving input order.
+
+    Args:
+        func: Function to call with each item
+        items: Items to process
+        max_workers: Maximum number of items processed concurrently
+        desc: Progress bar description (no progress bar if None)
+        on_result: Called in the calling thread with each result as it completes
+
+    Returns:
+        List of results in the same order as items
+    """
+    if not items:
+        return []
+
+    results = [None] * len(items)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        futures = {executor.submit(func, item): i for i, item in enumerate(items)}
+        for future in tqdm(
+            as_completed(futures), total=len(futures), desc=desc, disable=desc is None
+        ):
+            results[futures[future]] = future.result()
+            if on_result:
+                on_result(results[futures[future]])
+
+    return results
 
 
 def get_projects(client: httpx.Client) -> List[Dict]:
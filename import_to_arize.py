@@ -12,19 +12,15 @@ Usage:
 """
 
 import argparse
-import json
 import logging
 import sys
+import time
+from collections import Counter
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
 
-from importers import (
-    import_annotations,
-    import_datasets,
-    import_evaluations,
-    import_prompts,
-    import_traces,
-    setup_annotations,
-)
 from utils import parse_import_args
 
 # Configure logging
@@ -38,6 +34,97 @@ RESULTS_DIR = Path("./results")
 RESULTS_DIR.mkdir(exist_ok=True)
 
 
+# Record statuses counted as a successful import
+SUCCESS_STATUSES = ("imported", "already_exists", "skipped")
+
+
+def _list_records(result: Any) -> List[Dict]:
+    """Get status records from a list-shaped result (datasets, prompts)."""
+    return result if isinstance(result, list) else []
+
+
+def _project_records(result: Any) -> List[Dict]:
+    """Get status records from a result keyed by project name (traces)."""
+    if not isinstance(result, dict):
+        return []
+    # Skip any special keys like 'projects', 'timestamp', etc. and non-dict values
+    return [
+        value
+        for key, value in result.items()
+        if key not in ["projects", "timestamp"] and isinstance(value, dict)
+    ]
+
+
+def _project_success_records(result: Any) -> List[Dict]:
+    """Get status records from a result with per-project success flags (annotations, etc.)."""
+    if not isinstance(result, dict):
+        return []
+    return [
+        {**project, "status": "imported" if project.get("success") else "failed"}
+        for project in result.get("projects", {}).values()
+    ]
+
+
+def _run_import(
+    data_type: str,
+    import_fn: Callable[[str], Any],
+    results_path: Path,
+    get_records: Callable[[Any], List[Dict]],
+    count_key: Optional[str] = None,
+) -> bool:
+    """
+    Run an importer and summarize its results.
+
+    Args:
+        data_type: Plural name of the imported data, used in log messages
+        import_fn: Importer call, given the path of the results file to save
+        results_path: Path of the results file
+        get_records: Extracts the status records from the importer result
+        count_key: Record field holding the number of items imported (optional)
+
+    Returns:
+        True if any record was imported successfully, False otherwise
+    """
+    results_path_str = str(results_path)
+
+    try:
+        logger.info("Importing %s...", data_type)
+        result = import_fn(results_path_str)
+        records = get_records(result) if result else []
+
+        if not records:
+            logger.error("No %s were imported", data_type)
+            return False
+
+        statuses = Counter(record.get("status") for record in records)
+        success_count = sum(statuses[status] for status in SUCCESS_STATUSES)
+        breakdown = ", ".join(f"{count} {status}" for status, count in statuses.items())
+
+        if count_key:
+            total_count = sum(record.get(count_key, 0) for record in records)
+            logger.info(
+                "Imported %s %s from %s/%s projects (%s)",
+                total_count,
+                data_type,
+                success_count,
+                len(records),
+                breakdown,
+            )
+        else:
+            logger.info(
+                "%s import complete: %s/%s succeeded (%s)",
+                data_type.capitalize(),
+                success_count,
+                len(records),
+                breakdown,
+            )
+
+        return success_count > 0
+    except Exception as e:
+        logger.error("Error importing %s: %s", data_type, e)
+        return False
+
+
 def import_datasets_wrapper(args: argparse.Namespace) -> bool:
     """
     Import datasets from Phoenix export to Arize.
@@ -48,37 +135,21 @@ def import_datasets_wrapper(args: argparse.Namespace) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        logger.info("Importing datasets...")
-        results_path = RESULTS_DIR / "dataset_import_results.json"
-        result = import_datasets.import_datasets(
+    # Importers pull in the Arize SDK and pandas, so each is only loaded when its step runs
+    from importers import import_datasets
+
+    return _run_import(
+        "datasets",
+        lambda results_file: import_datasets.import_datasets(
             export_dir=args.export_dir,
             space_id=args.space_id,
             arize_api_key=args.api_key,
             verbose=args.verbose,
-            results_file=str(results_path),
-        )
-
-        # Count results, considering both "imported" and "already_exists" as success
-        if isinstance(result, list) and len(result) > 0:
-            new_count = sum(d.get("status") == "imported" for d in result)
-            existing_count = sum(d.get("status") == "already_exists" for d in result)
-
-            logger.info(f"Dataset import complete: {new_count} imported")
-
-            # Save results to file
-            with open(results_path, "w") as f:
-                json.dump(result, f, indent=2)
-                logger.info(f"Dataset import results saved to {results_path}")
-
-            # Return True if any datasets were processed successfully
-            return (new_count + existing_count) > 0
-        else:
-            logger.error("No datasets were imported")
-            return False
-    except Exception as e:
-        logger.error(f"Error importing datasets: {e}")
-        return False
+            results_file=results_file,
+        ),
+        RESULTS_DIR / "dataset_import_results.json",
+        _list_records,
+    )
 
 
 def import_traces_wrapper(args: argparse.Namespace) -> bool:
@@ -91,66 +162,40 @@ def import_traces_wrapper(args: argparse.Namespace) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        logger.info("Importing traces...")
-        results_path = RESULTS_DIR / "trace_import_results.json"
+    from importers import import_traces
+
+    results_path = RESULTS_DIR / "trace_import_results.json"
 
+    def run_import(results_file: str) -> Any:
         try:
-            result = import_traces.import_traces(
+            return import_traces.import_traces(
                 export_dir=args.export_dir,
                 space_id=args.space_id,
                 arize_api_key=args.api_key,
                 verbose=args.verbose,
-                results_file=str(results_path),
+                results_file=results_file,
             )
         except Exception as import_error:
-            logger.error(f"Error in import_traces.import_traces(): {import_error}")
+            logger.error("Error in import_traces.import_traces(): %s", import_error)
             # If the import failed but traces were already imported, try to load the results file
-            if results_path.exists():
-                try:
-                    with open(results_path, "r") as f:
-                        result = json.load(f)
-                        logger.info("Loaded existing trace import results from file")
-                except Exception as load_error:
-                    logger.error(f"Failed to load existing results: {load_error}")
-                    return False
-            else:
-                return False
-
-        if result and isinstance(result, dict) and len(result) > 0:
-            # Count successful imports by looking for entries with status 'imported' or 'skipped'
-            # The result should be a dict where keys are project names and values are status dicts
-            success_count = 0
-            total_processed = 0
-            for key, value in result.items():
-                # Skip any special keys like 'projects', 'timestamp', etc.
-                if key in ["projects", "timestamp"]:
-                    continue
-
-                # Ensure the value is a dictionary (project status info)
-                if isinstance(value, dict):
-                    total_processed += 1
-                    status = value.get("status", "")
-                    if status in ["imported", "skipped"]:
-                        success_count += 1
-                # If value is not a dict, skip it
-
-            logger.info(
-                f"Successfully processed traces from {success_count}/{total_processed} projects"
-            )
-
-            # Save results to file
-            with open(results_path, "w") as f:
-                json.dump(result, f, indent=2)
-                logger.info(f"Trace import results saved to {results_path}")
-
-            return success_count > 0
-        else:
-            logger.error("No traces were imported")
-            return False
-    except Exception as e:
-        logger.error(f"Error importing traces: {e}")
-        return False
+            if not results_path.exists():
+                return None
+            try:
+                with open(results_path, "rb") as f:
+                    result = orjson.loads(f.read())
+                    logger.info("Loaded existing trace import results from file")
+                    return result
+            except Exception as load_error:
+                logger.error("Failed to load existing results: %s", load_error)
+                return None
+
+    return _run_import(
+        "traces",
+        run_import,
+        results_path,
+        _project_records,
+        count_key="trace_count",
+    )
 
 
 def import_annotations_wrapper(args: argparse.Namespace) -> bool:
@@ -163,35 +208,21 @@ def import_annotations_wrapper(args: argparse.Namespace) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        logger.info("Importing annotations...")
-        results_path = RESULTS_DIR / "annotation_import_results.json"
-        result = import_annotations.import_annotations(
+    from importers import import_annotations
+
+    return _run_import(
+        "annotations",
+        lambda results_file: import_annotations.import_annotations(
             api_key=args.api_key,
             space_id=args.space_id,
             export_dir=args.export_dir,
-            results_file=str(results_path),
-        )
-
-        if result and isinstance(result, dict) and "projects" in result:
-            total_success = sum(1 for p in result["projects"].values() if p.get("success"))
-            total_annotations = sum(
-                p.get("annotations_count", 0) for p in result["projects"].values()
-            )
-            logger.info(f"Imported {total_annotations} annotations from {total_success} projects")
-
-            # Save results to file
-            with open(results_path, "w") as f:
-                json.dump(result, f, indent=2)
-                logger.info(f"Annotation import results saved to {results_path}")
-
-            return total_success > 0
-        else:
-            logger.error("No annotations were imported")
-            return False
-    except Exception as e:
-        logger.error(f"Error importing annotations: {e}")
-        return False
+            results_file=results_file,
+            batch_size=args.batch_size,
+        ),
+        RESULTS_DIR / "annotation_import_results.json",
+        _project_success_records,
+        count_key="annotations_count",
+    )
 
 
 def import_evaluations_wrapper(args: argparse.Namespace) -> bool:
@@ -204,36 +235,22 @@ def import_evaluations_wrapper(args: argparse.Namespace) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        logger.info("Importing evaluations...")
-        results_path = RESULTS_DIR / "evaluation_import_results.json"
-        result = import_evaluations.import_evaluations(
+    from importers import import_evaluations
+
+    return _run_import(
+        "evaluations",
+        lambda results_file: import_evaluations.import_evaluations(
             api_key=args.api_key,
             space_id=args.space_id,
             export_dir=args.export_dir,
-            results_file=str(results_path),
+            results_file=results_file,
             developer_key=getattr(args, "developer_key", None),
-        )
-
-        if result and isinstance(result, dict) and "projects" in result:
-            total_success = sum(1 for p in result["projects"].values() if p.get("success"))
-            total_evaluations = sum(
-                p.get("evaluations_count", 0) for p in result["projects"].values()
-            )
-            logger.info(f"Imported {total_evaluations} evaluations from {total_success} projects")
-
-            # Save results to file
-            with open(results_path, "w") as f:
-                json.dump(result, f, indent=2)
-                logger.info(f"Evaluation import results saved to {results_path}")
-
-            return total_success > 0
-        else:
-            logger.error("No evaluations were imported")
-            return False
-    except Exception as e:
-        logger.error(f"Error importing evaluations: {e}")
-        return False
+            batch_size=args.batch_size,
+        ),
+        RESULTS_DIR / "evaluation_import_results.json",
+        _project_success_records,
+        count_key="evaluations_count",
+    )
 
 
 def import_prompts_wrapper(args: argparse.Namespace) -> bool:
@@ -246,37 +263,20 @@ def import_prompts_wrapper(args: argparse.Namespace) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        logger.info("Importing prompts...")
-        results_path = RESULTS_DIR / "prompt_import_results.json"
-        result = import_prompts.import_prompts(
+    from importers import import_prompts
+
+    return _run_import(
+        "prompts",
+        lambda results_file: import_prompts.import_prompts(
             export_dir=args.export_dir,
             space_id=args.space_id,
             arize_api_key=args.api_key,
             verbose=args.verbose,
-            results_file=str(results_path),
-        )
-
-        # Count results, considering both "imported" and "already_exists" as success
-        if isinstance(result, list) and len(result) > 0:
-            new_count = sum(p.get("status") == "imported" for p in result)
-            existing_count = sum(p.get("status") == "already_exists" for p in result)
-
-            logger.info(f"Prompt import complete: {new_count} newly imported")
-
-            # Save results to file
-            with open(results_path, "w") as f:
-                json.dump(result, f, indent=2)
-                logger.info(f"Prompt import results saved to {results_path}")
-
-            # Return True if any prompts were processed successfully
-            return (new_count + existing_count) > 0
-        else:
-            logger.error("No prompts were imported")
-            return False
-    except Exception as e:
-        logger.error(f"Error importing prompts: {e}")
-        return False
+            results_file=results_file,
+        ),
+        RESULTS_DIR / "prompt_import_results.json",
+        _list_records,
+    )
 
 
 def setup_annotations_wrapper(args: argparse.Namespace) -> bool:
@@ -289,6 +289,8 @@ def setup_annotations_wrapper(args: argparse.Namespace) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    from importers import setup_annotations
+
     try:
         # Build command line args
         cmd_args = ["setup_annotations.py", "--export-dir", args.export_dir]
@@ -310,9 +312,39 @@ def setup_annotations_wrapper(args: argparse.Namespace) -> bool:
             sys.argv = original_argv
 
     except Exception as e:
-        logger.error(f"Error setting up annotations: {e}")
+        logger.error("Error setting up annotations: %s", e)
+        return False
+
+
+def _confirm(question: str, assume_yes: bool = False, wait_seconds: Optional[float] = None) -> bool:
+    """
+    Ask the user to confirm that a manual step in Arize is done.
+
+    Args:
+        question: Question to ask
+        assume_yes: Confirm without prompting (for automated runs)
+        wait_seconds: Wait this many seconds, then confirm without prompting
+
+    Returns:
+        True if confirmed, False otherwise
+    """
+    if wait_seconds is not None:
+        logger.info("Waiting %g seconds before continuing...", wait_seconds)
+        time.sleep(wait_seconds)
+        return True
+
+    if assume_yes:
+        logger.info("%s Assuming yes (--yes)", question)
+        return True
+
+    try:
+        confirmation = input(f"\n{question} (yes/no): ").lower()
+    except EOFError:
+        # No interactive input available, treat as not confirmed
         return False
 
+    return confirmation in ["yes", "y"]
+
 
 def main() -> None:
     """Main entry point for the script."""
@@ -385,11 +417,11 @@ def main() -> None:
         print("3. This may take a few minutes for large datasets")
         print("=======================================================")
 
-        confirmation = input(
-            "\nAre all traces fully visible in the Arize dashboard? (yes/no): "
-        ).lower()
-
-        if confirmation not in ["yes", "y"]:
+        if not _confirm(
+            "Are all traces fully visible in the Arize dashboard?",
+            assume_yes=args.yes,
+            wait_seconds=args.wait_for_traces,
+        ):
             logger.warning(
                 "Evaluation import skipped. Please wait for traces to be fully ingested."
             )
@@ -428,12 +460,10 @@ def main() -> None:
         print("3. Add all annotation types listed in the setup guide")
         print("=======================================================")
 
-        confirmation = input(
-            "\nHave you added all annotation configurations in Arize UI? (yes/no): "
-        ).lower()
-
         # Step 7: Import annotations if confirmed
-        if confirmation in ["yes", "y"]:
+        if _confirm(
+            "Have you added all annotation configurations in Arize UI?", assume_yes=args.yes
+        ):
             logger.info("Step 7/7: Importing annotations...")
             if import_annotations_wrapper(args):
                 successful_imports.append("annotations")
@@ -455,10 +485,10 @@ def main() -> None:
     # Print summary
     print("\n=== Import Summary ===")
     if successful_imports:
-        logger.info(f"Successfully imported: {', '.join(successful_imports)}")
+        logger.info("Successfully imported: %s", ", ".join(successful_imports))
 
     if failed_imports:
-        logger.error(f"Failed to import: {', '.join(failed_imports)}")
+        logger.error("Failed to import: %s", ", ".join(failed_imports))
 
     if failed_imports:
         sys.exit(1)
@@ -15,13 +15,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
 import pandas as pd
 from tqdm import tqdm
 
 from .utils import (
     RESULTS_DIR,
+    find_traces_file,
     get_projects,
+    iter_traces_file,
+    log_in_batches,
     parse_common_args,
+    positive_int,
     save_results_to_file,
     setup_logging,
     validate_required_args,
@@ -226,7 +231,7 @@ def check_traces(api_key: str, space_id: str, project_name: str) -> bool:
 
 
 def import_annotations(
-    api_key: str, space_id: str, export_dir: str, results_file: str
+    api_key: str, space_id: str, export_dir: str, results_file: str, batch_size: int = 100
 ) -> Dict[str, Any]:
     """
     Import annotations from Phoenix export to Arize.
@@ -236,6 +241,7 @@ def import_annotations(
         space_id: Arize Space ID
         export_dir: Path to Phoenix export directory
         results_file: Path to save results
+        batch_size: Maximum number of annotations sent per request
 
     Returns:
         Dictionary with import results
@@ -283,8 +289,8 @@ def import_annotations(
     # Load previous results if they exist
     previous_results = {}
     if os.path.exists(results_file):
-        with open(results_file, "r") as f:
-            previous_results = json.load(f)
+        with open(results_file, "rb") as f:
+            previous_results = orjson.loads(f.read())
 
     # Get all projects
     projects = get_projects(export_dir)
@@ -332,19 +338,17 @@ def import_annotations(
             continue
 
         # Load traces file to get valid span_ids for this project
-        traces_file = project_dir / "traces.json"
+        traces_file = find_traces_file(project_dir)
         trace_span_ids = set()
-        if traces_file.exists():
+        if traces_file:
             try:
-                with open(traces_file, "r") as f:
-                    traces = json.load(f)
-                    # Extract trace and span IDs
-                    for trace in traces:
-                        for key, value in trace.items():
-                            if isinstance(value, str) and (
-                                "span_id" in key or "context.span_id" in key
-                            ):
-                                trace_span_ids.add(value)
+                # Extract trace and span IDs
+                for trace in iter_traces_file(traces_file):
+                    for key, value in trace.items():
+                        if isinstance(value, str) and (
+                            "span_id" in key or "context.span_id" in key
+                        ):
+                            trace_span_ids.add(value)
             except Exception as e:
                 logger.warning(f"Could not read traces file: {e}")
 
@@ -391,38 +395,40 @@ def import_annotations(
                 )
 
             # Log annotations in batches to avoid timeouts
-            batch_size = 10
             total_annotations = len(df)
-            success_count = 0
-
-            for i in range(0, total_annotations, batch_size):
-                batch_df = df.iloc[i : i + batch_size].copy()
-                try:
-                    batch_num = i // batch_size + 1
-                    total_batches = (total_annotations - 1) // batch_size + 1
-                    logger.info(
-                        f"Sending batch {batch_num}/{total_batches} "
-                        f"({len(batch_df)} annotations)"
-                    )
-                    response = arize_client.log_annotations(
-                        dataframe=batch_df,
-                        project_name=project_name,
-                    )
-                    logger.debug(f"Batch response: {response}")
-                    success_count += len(batch_df)
-                except Exception as batch_error:
-                    logger.error(f"Error in batch {i//batch_size + 1}: {batch_error}")
+            batches = log_in_batches(
+                lambda batch_df: arize_client.log_annotations(
+                    dataframe=batch_df,
+                    project_name=project_name,
+                ),
+                df,
+                batch_size=batch_size,
+                description="annotations",
+            )
+            success_count = batches.sent
+            if batches.aborted:
+                message = (
+                    f"Stopped early, {batches.unsent}/{total_annotations} annotations not sent"
+                )
+            elif batches.unsent:
+                message = (
+                    f"Imported {success_count}/{total_annotations} annotations, "
+                    f"{batches.unsent} not sent"
+                )
+            else:
+                message = f"Successfully imported {success_count}/{total_annotations} annotations"
 
+            # A project with rows left unsent is not marked successful, so the next run
+            # retries it instead of skipping it as already imported
             results["projects"][project_name] = {
-                "success": success_count > 0,
+                "success": success_count > 0 and not batches.unsent,
                 "annotations_count": success_count,
-                "message": f"Successfully imported {success_count}/{total_annotations} annotations",
+                "rejected_count": batches.rejected,
+                "unsent_count": batches.unsent,
+                "message": message,
                 "span_ids": df["context.span_id"].tolist(),
             }
-            logger.info(
-                f"Successfully imported {success_count}/{total_annotations} annotations "
-                f"for {project_name}"
-            )
+            logger.info(f"{message} for {project_name}")
 
         except Exception as e:
             logger.error(f"Error importing annotations for project {project_name}: {e}")
@@ -434,8 +440,7 @@ def import_annotations(
             }
 
     # Save results
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    save_results_to_file(results, results_file, "Annotation import results")
 
     # Print summary
     total_success = sum(1 for p in results["projects"].values() if p.get("success"))
@@ -457,6 +462,12 @@ def main() -> None:
         default=str(RESULTS_DIR / "annotation_import_results.json"),
         help="File to store import results (default: results/annotation_import_results.json)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=100,
+        help="Maximum number of annotations sent per request (default: 100)",
+    )
 
     args = parser.parse_args()
 
@@ -473,10 +484,10 @@ def main() -> None:
         space_id=args.space_id,
         export_dir=args.export_dir,
         results_file=args.results_file,
+        batch_size=args.batch_size,
     )
 
     if result and result.get("projects"):
-        save_results_to_file(result, args.results_file, "Annotation import results")
         successful = result["summary"]["successful_projects"]
         total = result["summary"]["total_projects"]
         print(f"Successfully imported annotations from {successful}/{total} projects")
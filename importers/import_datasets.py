@@ -9,10 +9,12 @@ converts them to the format expected by Arize, and imports them.
 
 import json
 import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import orjson
 import pandas as pd
 from arize.experimental.datasets import ArizeDatasetsClient
 from arize.experimental.datasets.utils.constants import GENERATIVE
@@ -214,8 +216,8 @@ def import_datasets(
     previously_imported = {}
     if results_path.exists():
         try:
-            with open(results_path, "r") as f:
-                imported_data = json.load(f)
+            with open(results_path, "rb") as f:
+                imported_data = orjson.loads(f.read())
                 for item in imported_data:
                     # Track by both ID and name to prevent duplicates
                     previously_imported[item.get("phoenix_id")] = item
@@ -311,15 +313,19 @@ def import_datasets(
         imported_datasets.append(dataset_info)
 
     # Count successful imports
-    new_count = sum(d.get("status") == "imported" for d in imported_datasets)
-    existing_count = sum(d.get("status") == "already_exists" for d in imported_datasets)
-    error_count = sum(d.get("status") == "error" for d in imported_datasets)
+    statuses = Counter(d.get("status") for d in imported_datasets)
+    new_count = statuses["imported"]
+    existing_count = statuses["already_exists"]
+    error_count = statuses["error"]
 
     print(
         f"Processed {len(imported_datasets)} datasets: {new_count} imported, "
         f"{existing_count} existing, {error_count} errors"
     )
 
+    # Save results to file
+    save_results_to_file(imported_datasets, results_path, "Dataset import results")
+
     return imported_datasets
 
 
@@ -356,7 +362,6 @@ def main() -> None:
     )
 
     if result:
-        save_results_to_file(result, args.results_file, "Dataset import results")
         print(f"Successfully imported {len(result)} datasets")
     else:
         print("No datasets were imported")
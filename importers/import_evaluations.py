@@ -14,13 +14,18 @@ import traceback
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
 import pandas as pd
 from tqdm import tqdm
 
 from .utils import (
     RESULTS_DIR,
+    find_traces_file,
     get_projects,
+    iter_traces_file,
+    log_in_batches,
     parse_common_args,
+    positive_int,
     save_results_to_file,
     setup_logging,
     validate_required_args,
@@ -221,7 +226,12 @@ def check_traces(api_key: str, space_id: str, project_name: str, developer_key:
 
 
 def import_evaluations(
-    api_key: str, space_id: str, export_dir: str, results_file: str, developer_key: str = None
+    api_key: str,
+    space_id: str,
+    export_dir: str,
+    results_file: str,
+    developer_key: str = None,
+    batch_size: int = 100,
 ) -> Dict[str, Any]:
     """
     Import evaluations from Phoenix export to Arize.
@@ -232,6 +242,7 @@ def import_evaluations(
         export_dir: Path to Phoenix export directory
         results_file: Path to save results
         developer_key: Arize Developer Key (optional)
+        batch_size: Maximum number of evaluations sent per request
 
     Returns:
         Dictionary with import results
@@ -284,8 +295,8 @@ def import_evaluations(
     # Load previous results if they exist
     previous_results = {}
     if os.path.exists(results_file):
-        with open(results_file, "r") as f:
-            previous_results = json.load(f)
+        with open(results_file, "rb") as f:
+            previous_results = orjson.loads(f.read())
 
     # Get all projects
     projects = get_projects(export_dir)
@@ -331,19 +342,17 @@ def import_evaluations(
             continue
 
         # Load traces file to get valid span_ids for this project
-        traces_file = project_dir / "traces.json"
+        traces_file = find_traces_file(project_dir)
         trace_span_ids = set()
-        if traces_file.exists():
+        if traces_file:
             try:
-                with open(traces_file, "r") as f:
-                    traces = json.load(f)
-                    # Extract trace and span IDs
-                    for trace in traces:
-                        for key, value in trace.items():
-                            if isinstance(value, str) and (
-                                "span_id" in key or "context.span_id" in key
-                            ):
-                                trace_span_ids.add(value)
+                # Extract trace and span IDs
+                for trace in iter_traces_file(traces_file):
+                    for key, value in trace.items():
+                        if isinstance(value, str) and (
+                            "span_id" in key or "context.span_id" in key
+                        ):
+                            trace_span_ids.add(value)
 
                 logger.info(f"Found {len(trace_span_ids)} span IDs in traces file")
             except Exception as e:
@@ -392,35 +401,40 @@ def import_evaluations(
                 )
 
             # Log evaluations in batches to avoid timeouts
-            batch_size = 10
             total_evaluations = len(df)
-            success_count = 0
-
-            for i in range(0, total_evaluations, batch_size):
-                batch_df = df.iloc[i : i + batch_size].copy()
-                try:
-                    logger.info(
-                        f"Sending batch {i//batch_size + 1}/{(total_evaluations-1)//batch_size + 1}"
-                        f"({len(batch_df)} evaluations)"
-                    )
-                    arize_client.log_evaluations_sync(
-                        dataframe=batch_df,
-                        project_name=project_name,
-                    )
-                    success_count += len(batch_df)
-                except Exception as batch_error:
-                    logger.error(f"Error in batch {i//batch_size + 1}: {batch_error}")
+            batches = log_in_batches(
+                lambda batch_df: arize_client.log_evaluations_sync(
+                    dataframe=batch_df,
+                    project_name=project_name,
+                ),
+                df,
+                batch_size=batch_size,
+                description="evaluations",
+            )
+            success_count = batches.sent
+            if batches.aborted:
+                message = (
+                    f"Stopped early, {batches.unsent}/{total_evaluations} evaluations not sent"
+                )
+            elif batches.unsent:
+                message = (
+                    f"Imported {success_count}/{total_evaluations} evaluations, "
+                    f"{batches.unsent} not sent"
+                )
+            else:
+                message = f"Successfully imported {success_count}/{total_evaluations} evaluations"
 
+            # A project with rows left unsent is not marked successful, so the next run
+            # retries it instead of skipping it as already imported
             results["projects"][project_name] = {
-                "success": success_count > 0,
+                "success": success_count > 0 and not batches.unsent,
                 "evaluations_count": success_count,
-                "message": f"Successfully imported {success_count}/{total_evaluations} evaluations",
+                "rejected_count": batches.rejected,
+                "unsent_count": batches.unsent,
+                "message": message,
                 "span_ids": df["context.span_id"].tolist(),
             }
-            logger.info(
-                f"Successfully imported {success_count}/{total_evaluations} evaluations "
-                f"for project {project_name}"
-            )
+            logger.info(f"{message} for project {project_name}")
 
         except Exception as e:
             results["projects"][project_name] = {
@@ -430,8 +444,7 @@ def import_evaluations(
             }
 
     # Save results
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    save_results_to_file(results, results_file, "Evaluation import results")
 
     # Print summary
     total_success = sum(1 for p in results["projects"].values() if p.get("success"))
@@ -459,6 +472,12 @@ def main() -> None:
         default=str(RESULTS_DIR / "evaluation_import_results.json"),
         help="File to store import results (default: results/evaluation_import_results.json)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=100,
+        help="Maximum number of evaluations sent per request (default: 100)",
+    )
 
     args = parser.parse_args()
 
@@ -476,10 +495,10 @@ def main() -> None:
         export_dir=args.export_dir,
         results_file=args.results_file,
         developer_key=getattr(args, "developer_key", None),
+        batch_size=args.batch_size,
     )
 
     if result and result.get("projects"):
-        save_results_to_file(result, args.results_file, "Evaluation import results")
         successful = result["summary"]["successful_projects"]
         total = result["summary"]["total_projects"]
         print(f"Successfully imported evaluations from {successful}/{total} projects")
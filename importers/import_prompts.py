@@ -9,10 +9,12 @@ expected by Arize's Prompt Hub, and imports them.
 
 import json
 import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import orjson
 from arize.experimental.prompt_hub import ArizePromptClient, LLMProvider, Prompt
 from tqdm import tqdm
 
@@ -164,8 +166,8 @@ def import_prompts(
     previously_imported = {}
     if results_path.exists():
         try:
-            with open(results_path, "r") as f:
-                imported_data = json.load(f)
+            with open(results_path, "rb") as f:
+                imported_data = orjson.loads(f.read())
                 for item in imported_data:
                     # Track by both ID and name to prevent duplicates
                     phoenix_id = item.get("phoenix_id")
@@ -269,15 +271,19 @@ def import_prompts(
         imported_prompts.append(prompt_info)
 
     # Count successful and already existing imports
-    success_count = sum(p.get("status") == "imported" for p in imported_prompts)
-    existing_count = sum(p.get("status") == "already_exists" for p in imported_prompts)
-    error_count = sum(p.get("status") == "error" for p in imported_prompts)
+    statuses = Counter(p.get("status") for p in imported_prompts)
+    success_count = statuses["imported"]
+    existing_count = statuses["already_exists"]
+    error_count = statuses["error"]
 
     print(
         f"Processed {len(imported_prompts)} prompts: {success_count} imported"
         f"{existing_count} existing, {error_count} errors"
     )
 
+    # Save results to file
+    save_results_to_file(imported_prompts, results_path, "Prompt import results")
+
     return imported_prompts
 
 
@@ -314,7 +320,6 @@ def main() -> None:
     )
 
     if result:
-        save_results_to_file(result, args.results_file, "Prompt import results")
         print(f"Successfully processed {len(result)} prompts")
     else:
         print("No prompts were imported")
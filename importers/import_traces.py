@@ -12,14 +12,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import orjson
 import pandas as pd
 from arize.pandas.logger import Client
 from tqdm import tqdm
 
 from .utils import (
     RESULTS_DIR,
+    find_traces_file,
     get_projects,
-    load_json_file,
+    iter_traces_file,
     parse_common_args,
     phoenix_timestamp_to_nanos_utc,
     save_results_to_file,
@@ -38,12 +40,17 @@ def get_project_traces(export_dir: Union[str, Path], project_name: str) -> List[
     Returns:
         List of trace dictionaries
     """
-    traces_path = Path(export_dir) / "projects" / project_name / "traces.json"
-    if not traces_path.exists():
-        print(f"Traces file not found: {traces_path}")
+    project_dir = Path(export_dir) / "projects" / project_name
+    traces_path = find_traces_file(project_dir)
+    if traces_path is None:
+        print(f"Traces file not found in {project_dir}")
         return []
 
-    return load_json_file(traces_path) or []
+    try:
+        return list(iter_traces_file(traces_path))
+    except Exception as e:
+        print(f"Error loading {traces_path}: {e}")
+        return []
 
 
 def convert_traces_to_dataframe(traces: List[Dict], verbose: bool = False) -> pd.DataFrame:
@@ -199,11 +206,10 @@ def import_traces(
     # Find all projects with traces
     projects = get_projects(export_dir)
 
-    # Filter to only projects that have a traces.json file
+    # Filter to only projects that have an exported traces file
     projects_with_traces = []
     for project_name in projects:
-        traces_path = Path(export_dir) / "projects" / project_name / "traces.json"
-        if traces_path.exists():
+        if find_traces_file(Path(export_dir) / "projects" / project_name):
             projects_with_traces.append(project_name)
 
     print(f"Found {len(projects_with_traces)} projects to import traces from")
@@ -217,8 +223,8 @@ def import_traces(
     previous_results = {}
     if results_path.exists():
         try:
-            with open(results_path, "r") as f:
-                previous_results = json.load(f)
+            with open(results_path, "rb") as f:
+                previous_results = orjson.loads(f.read())
         except Exception as e:
             print(f"Error loading previous results: {str(e)}")
 
@@ -291,8 +297,7 @@ def import_traces(
         results[project_name] = import_info
 
     # Save results to file
-    with open(results_path, "w") as f:
-        json.dump(results, f, indent=2)
+    save_results_to_file(results, results_path, "Trace import results")
 
     # Count successfully imported projects
     imported_count = sum(info.get("status") == "imported" for info in results.values())
@@ -332,7 +337,6 @@ def main() -> None:
     )
 
     if result:
-        save_results_to_file(result, args.results_file, "Trace import results")
         success_count = sum(
             1 for r in result.values() if isinstance(r, dict) and r.get("status") == "imported"
         )
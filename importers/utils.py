@@ -7,15 +7,31 @@ to reduce code duplication and maintain consistency.
 """
 
 import argparse
-import json
+import gzip
 import logging
 import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
+import orjson
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Load environment variables
 load_dotenv()
 
@@ -33,6 +49,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Trace files written by the exporter, in order of preference
+TRACES_FILENAMES = ("traces.ndjson.gz", "traces.json")
+
 
 def load_json_file(file_path: Union[str, Path]) -> Optional[Any]:
     """
@@ -45,8 +64,8 @@ def load_json_file(file_path: Union[str, Path]) -> Optional[Any]:
         Parsed JSON data or None if the file cannot be loaded
     """
     try:
-        with open(file_path, "r") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
     except Exception as e:
         logger.error(f"Error loading {file_path}: {e}")
         return None
@@ -90,6 +109,47 @@ def get_project_metadata(export_dir: Union[str, Path], project_name: str) -> Opt
     return load_json_file(metadata_path)
 
 
+def find_traces_file(project_dir: Union[str, Path]) -> Optional[Path]:
+    """
+    Find the exported traces file in a project directory.
+
+    Args:
+        project_dir: Path to the exported project directory
+
+    Returns:
+        Path to traces.ndjson.gz or, failing that, traces.json, or None if neither exists
+    """
+    for filename in TRACES_FILENAMES:
+        traces_path = Path(project_dir) / filename
+        if traces_path.exists():
+            return traces_path
+    return None
+
+
+def iter_traces_file(traces_path: Union[str, Path]) -> Iterator[Dict]:
+    """
+    Read spans from an exported traces file one at a time.
+
+    Gzip-compressed NDJSON files are decoded line by line; plain JSON files (written
+    with --no-compress) are parsed whole.
+
+    Args:
+        traces_path: Path to traces.ndjson.gz or traces.json
+
+    Yields:
+        Span dictionaries
+    """
+    traces_path = Path(traces_path)
+    if traces_path.suffix == ".gz":
+        with gzip.open(traces_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+    else:
+        with open(traces_path, "rb") as f:
+            yield from orjson.loads(f.read())
+
+
 def phoenix_timestamp_to_nanos_utc(timestamp_str: Optional[str]) -> Optional[int]:
     """
     Convert Phoenix timestamp string (e.g., "2025-05-13T05:12:32.418894000Z")
@@ -202,6 +262,38 @@ def validate_required_args(api_key: Optional[str], space_id: Optional[str]) -> b
     return True
 
 
+def write_json_stream(data: Any, f: IO[bytes], depth: int = 2, indent: int = 0) -> None:
+    """
+    Write JSON to an open file one entry at a time.
+
+    The outer ``depth`` levels of lists and dicts are written entry by entry, each
+    entry encoded on its own with orjson, so the whole document is never built as
+    one string.
+
+    Args:
+        data: JSON-serializable data to write
+        f: File opened for writing in binary mode
+        depth: Number of container levels to write entry by entry
+        indent: Current indentation level (used for recursion)
+    """
+    if depth <= 0 or not isinstance(data, (dict, list)) or not data:
+        f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        return
+
+    opening, closing = (b"{", b"}") if isinstance(data, dict) else (b"[", b"]")
+    padding = b"  " * (indent + 1)
+    items = data.items() if isinstance(data, dict) else enumerate(data)
+
+    f.write(opening)
+    for i, (key, value) in enumerate(items):
+        f.write(b",\n" if i else b"\n")
+        f.write(padding)
+        if isinstance(data, dict):
+            f.write(orjson.dumps(str(key)) + b": ")
+        write_json_stream(value, f, depth - 1, indent + 1)
+    f.write(b"\n" + b"  " * indent + closing)
+
+
 def save_results_to_file(
     results: Any, file_path: Union[str, Path], description: str = "results"
 ) -> None:
@@ -214,13 +306,196 @@ def save_results_to_file(
         description: Description of the results for logging
     """
     try:
-        with open(file_path, "w") as f:
-            json.dump(results, f, indent=2)
+        with open(file_path, "wb") as f:
+            write_json_stream(results, f)
         logger.info(f"{description.capitalize()} saved to {file_path}")
     except Exception as e:
         logger.error(f"Error saving {description} to {file_path}: {e}")
 
 
+def positive_int(value: str) -> int:
+    """Argparse type for an integer that is 1 or greater."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be 1 or greater, got {value}")
+    return number
+
+
+def _error_status_code(error: Exception) -> Optional[int]:
+    """Get the HTTP status code of a failed request, if the error carries a response."""
+    return getattr(getattr(error, "response", None), "status_code", None)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Check whether a failed batch is worth sending again unchanged.
+
+    Args:
+        error: Exception raised while sending a batch
+
+    Returns:
+        True for connection failures, timeouts, 429 and 5xx responses, False otherwise
+    """
+    status_code = _error_status_code(error)
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+    # requests exceptions derive from OSError, like the built-in connection errors
+    return isinstance(error, (OSError, TimeoutError))
+
+
+def is_row_error(error: Exception) -> bool:
+    """
+    Check whether a failed batch could be caused by specific rows in it.
+
+    Transient errors and HTTP errors other than 400, 413 and 422 (bad key, missing
+    project) fail every batch alike, so splitting cannot help.
+
+    Args:
+        error: Exception raised while sending a batch
+
+    Returns:
+        True if sending smaller batches might succeed, False otherwise
+    """
+    status_code = _error_status_code(error)
+    if status_code is not None:
+        return status_code in (400, 413, 422)
+    return not is_transient_error(error)
+
+
+class BatchResult(NamedTuple):
+    """Outcome of sending a DataFrame with log_in_batches."""
+
+    sent: int  # Rows accepted by Arize
+    rejected: int  # Rows skipped because they failed on their own
+    unsent: int  # Rows not sent because of other errors, or because sending stopped early
+    aborted: bool  # Whether sending stopped before every row was attempted
+
+
+def log_in_batches(
+    send: Callable[["pd.DataFrame"], Any],
+    df: "pd.DataFrame",
+    batch_size: int = 100,
+    description: str = "records",
+    max_retries: int = 3,
+    retry_backoff: float = 1.0,
+    max_skipped_rows: int = 5,
+) -> BatchResult:
+    """
+    Send a DataFrame to Arize in batches whose size adapts to failures.
+
+    Batches start at ``batch_size`` rows. A batch that fails with a transient error (see
+    is_transient_error) is sent again after an exponential backoff, up to ``max_retries``
+    times. A batch that fails with a row-level error (see is_row_error) is retried at half
+    the size, and each successful batch grows the next one by a tenth of ``batch_size``
+    (additive increase, multiplicative decrease). A single row that still fails, or a
+    batch that fails for any other reason, is skipped and the size goes back to
+    ``batch_size``.
+
+    Sending stops early only while no batch has been accepted yet: on a batch that fails
+    with a non-row error, or after ``max_skipped_rows`` skipped rows. That is the case of
+    a bad key or a project Arize does not know, where every batch would fail.
+
+    Args:
+        send: Function that sends one batch DataFrame to Arize
+        df: DataFrame with all rows to send
+        batch_size: Maximum number of rows per batch (1 or greater)
+        description: Description of the rows for logging
+        max_retries: Times a batch is sent again after a transient error
+        retry_backoff: Wait before the first resend in seconds, doubled on each resend
+        max_skipped_rows: Skipped rows before giving up while nothing has been accepted
+
+    Returns:
+        BatchResult with the rows sent, rejected and left unsent, and whether sending
+        stopped early
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be 1 or greater, got {batch_size}")
+
+    total = len(df)
+    size = batch_size
+    step = max(1, batch_size // 10)
+    offset = 0
+    success_count = 0
+    rejected_count = 0
+    unsent_count = 0
+    skipped_rows = 0
+    retries = 0
+
+    while offset < total:
+        batch_df = df.iloc[offset : offset + size].copy()
+        try:
+            logger.info(
+                "Sending %s %s (%s/%s sent)", len(batch_df), description, success_count, total
+            )
+            response = send(batch_df)
+            logger.debug("Batch response: %s", response)
+        except Exception as batch_error:
+            if is_transient_error(batch_error) and retries < max_retries:
+                delay = retry_backoff * 2**retries
+                retries += 1
+                logger.warning(
+                    "Error sending %s %s, retrying in %.1f seconds (%s/%s): %s",
+                    len(batch_df),
+                    description,
+                    delay,
+                    retries,
+                    max_retries,
+                    batch_error,
+                )
+                time.sleep(delay)
+                continue
+            retries = 0
+
+            row_error = is_row_error(batch_error)
+            if row_error and len(batch_df) > 1:
+                size = len(batch_df) // 2
+                logger.warning(
+                    "Error sending %s %s, retrying in batches of %s: %s",
+                    len(batch_df),
+                    description,
+                    size,
+                    batch_error,
+                )
+                continue
+
+            logger.error(
+                "Skipping %s %s at row %s: %s", len(batch_df), description, offset, batch_error
+            )
+            offset += len(batch_df)
+            size = batch_size
+            if row_error:
+                rejected_count += len(batch_df)
+                skipped_rows += 1
+            else:
+                unsent_count += len(batch_df)
+
+            if (
+                success_count == 0
+                and offset < total
+                and (not row_error or skipped_rows >= max_skipped_rows)
+            ):
+                logger.error(
+                    "Giving up on the remaining %s %s, Arize has not accepted any batch",
+                    total - offset,
+                    description,
+                )
+                return BatchResult(
+                    sent=0,
+                    rejected=rejected_count,
+                    unsent=unsent_count + total - offset,
+                    aborted=True,
+                )
+        else:
+            retries = 0
+            success_count += len(batch_df)
+            size = min(batch_size, size + step)
+            offset += len(batch_df)
+
+    return BatchResult(
+        sent=success_count, rejected=rejected_count, unsent=unsent_count, aborted=False
+    )
+
+
 def parse_common_args(description: str) -> argparse.ArgumentParser:
     """
     Create an argument parser with common arguments for import scripts.
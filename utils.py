@@ -7,13 +7,23 @@ import argparse
 import logging
 import os
 import random
+import threading
 import time
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Any, Callable, Dict, List, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 import httpx
 from dotenv import load_dotenv
 
+# HTTP/2 support in httpx requires the optional h2 package
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Load environment variables
@@ -26,6 +36,22 @@ class RetryableError(Exception):
     pass
 
 
+def non_negative_float(value: str) -> float:
+    """Argparse type for a float that is zero or greater."""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be zero or greater, got {value}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for an integer that is 1 or greater."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be 1 or greater, got {value}")
+    return number
+
+
 def parse_export_args() -> argparse.Namespace:
     """
     Parse command line arguments.
@@ -85,6 +111,20 @@ def parse_export_args() -> argparse.Namespace:
         help="Project name to export (can be used multiple times, omit to export all projects)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum requests in flight per export step; annotation export splits this "
+        "between projects and their annotation batches (default: 4)",
+    )
+
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Write traces as indented traces.json instead of traces.ndjson.gz",
+    )
+
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
     # Retry configuration
@@ -212,6 +252,136 @@ def retry_with_backoff(
     return decorator
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Number of seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    HTTPX transport that retries rate-limited and failed requests.
+
+    Waits honor the server's Retry-After header and otherwise use decorrelated jitter,
+    so concurrent workers do not retry in lockstep. A 429 or 503 response also pauses
+    every new request to that host until the wait is over, throttling all workers
+    sharing the client instead of letting each one hit the limit on its own.
+    """
+
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    THROTTLE_STATUS_CODES = (429, 503)
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        max_attempts: int = 5,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        backoff_factor: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            transport: Transport used to send the requests
+            max_attempts: Maximum number of attempts per request
+            initial_backoff: Minimum backoff time in seconds
+            max_backoff: Maximum backoff time in seconds
+            backoff_factor: Growth factor for the backoff upper bound on each retry
+        """
+        self._transport = transport
+        self._max_attempts = max_attempts
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._backoff_factor = backoff_factor
+        self._lock = threading.Lock()
+        self._throttled_until: Dict[str, float] = {}
+
+    def _next_backoff(self, previous: float) -> float:
+        """Pick the next backoff using decorrelated jitter."""
+        upper = min(self._max_backoff, previous * self._backoff_factor)
+        return random.uniform(self._initial_backoff, max(self._initial_backoff, upper))
+
+    def _wait_for_host(self, host: str) -> None:
+        """Sleep while the host is throttled."""
+        with self._lock:
+            delay = self._throttled_until.get(host, 0.0) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _throttle_host(self, host: str, wait_time: float) -> None:
+        """Hold back new requests to the host for wait_time seconds."""
+        with self._lock:
+            self._throttled_until[host] = max(
+                self._throttled_until.get(host, 0.0), time.monotonic() + wait_time
+            )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        backoff = self._initial_backoff
+        attempt = 1
+
+        while True:
+            self._wait_for_host(host)
+            try:
+                response = self._transport.handle_request(request)
+            except (httpx.ConnectError, httpx.ReadTimeout) as e:
+                if attempt >= self._max_attempts:
+                    raise
+                backoff = self._next_backoff(backoff)
+                logger.warning(
+                    "Request failed with error: %s, retrying in %.1f seconds... (%s/%s)",
+                    e,
+                    backoff,
+                    attempt,
+                    self._max_attempts,
+                )
+                time.sleep(backoff)
+                attempt += 1
+                continue
+
+            if response.status_code not in self.RETRY_STATUS_CODES or (
+                attempt >= self._max_attempts
+            ):
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            response.close()
+
+            backoff = self._next_backoff(backoff)
+            # Honor Retry-After, but never hold the host back longer than max_backoff
+            wait_time = min(retry_after, self._max_backoff) if retry_after is not None else backoff
+            if response.status_code in self.THROTTLE_STATUS_CODES:
+                self._throttle_host(host, wait_time)
+
+            logger.warning(
+                "Request failed with status %s, retrying in %.1f seconds... (%s/%s)",
+                response.status_code,
+                wait_time,
+                attempt,
+                self._max_attempts,
+            )
+            time.sleep(wait_time)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
 def create_client_with_retry(
     base_url: str,
     headers: Dict[str, str],
@@ -220,6 +390,8 @@ def create_client_with_retry(
     initial_backoff: float = 1.0,
     max_backoff: float = 60.0,
     backoff_factor: float = 2.0,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
 ) -> httpx.Client:
     """
     Create an HTTPX client with retry capabilities.
@@ -232,70 +404,37 @@ def create_client_with_retry(
         initial_backoff: Initial backoff time in seconds
         max_backoff: Maximum backoff time in seconds
         backoff_factor: Multiplier for backoff on each retry
+        limits: Connection pool limits (default: httpx defaults)
+        http2: Whether to enable HTTP/2 (requires the h2 package)
 
     Returns:
         HTTPX client with retry capabilities
     """
-    # Create a custom transport with retry logic
-    transport = httpx.HTTPTransport(
-        retries=max_attempts,
-        verify=True,  # Verify SSL certificates
+    if http2 and not HTTP2_AVAILABLE:
+        logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+        http2 = False
+
+    # Pool limits and HTTP/2 are set on the inner transport because httpx ignores the
+    # client-level options when a transport is given.
+    transport = RetryTransport(
+        httpx.HTTPTransport(
+            retries=0,  # RetryTransport owns retries, including failed connects
+            verify=True,  # Verify SSL certificates
+            limits=limits or httpx.Limits(),
+            http2=http2,
+        ),
+        max_attempts=max_attempts,
+        initial_backoff=initial_backoff,
+        max_backoff=max_backoff,
+        backoff_factor=backoff_factor,
     )
 
     # Create the client with the custom transport
     client = httpx.Client(base_url=base_url, headers=headers, timeout=timeout, transport=transport)
 
-    # Add retry logic for specific status codes
-    def retry_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
-        """
-        Make an HTTP request with retry logic.
-
-        Args:
-            method: HTTP method (GET, POST, etc.)
-            url: URL to request
-            **kwargs: Additional arguments to pass to the request
-
-        Returns:
-            HTTP response
-
-        Raises:
-            httpx.HTTPError: If the request fails after all retries
-        """
-        attempt = 0
-        backoff = initial_backoff
-
-        while attempt < max_attempts:
-            try:
-                response = client.request(method, url, **kwargs)
-
-                # Check if we need to retry
-                if response.status_code in [429, 500, 502, 503, 504]:
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"Request failed with status {response.status_code}, "
-                            f"retrying in {backoff:.1f} seconds..."
-                        )
-                        time.sleep(backoff)
-                        backoff = min(backoff * backoff_factor, max_backoff)
-                        attempt += 1
-                        continue
-
-                return response
-
-            except (httpx.ConnectError, httpx.ReadTimeout) as e:
-                if attempt < max_attempts - 1:
-                    logger.warning(
-                        f"Request failed with error: {str(e)}, "
-                        f"retrying in {backoff:.1f} seconds..."
-                    )
-                    time.sleep(backoff)
-                    backoff = min(backoff * backoff_factor, max_backoff)
-                    attempt += 1
-                    continue
-                raise
-
-    # Add the retry_request method to the client
-    client.retry_request = retry_request
+    # Every request made through the client is retried by the transport; retry_request is
+    # kept for callers that still use it
+    client.retry_request = client.request
 
     return client
 
@@ -410,6 +549,27 @@ def parse_import_args() -> argparse.Namespace:
         help="Run the annotation setup guide (do this before importing annotations)",
     )
 
+    # Confirmation gates
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Answer yes to all confirmation prompts (for automated runs)",
+    )
+
+    parser.add_argument(
+        "--wait-for-traces",
+        type=non_negative_float,
+        metavar="SECONDS",
+        help="Wait this many seconds for trace ingestion instead of prompting before evaluations",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=100,
+        help="Maximum number of annotations or evaluations sent per request (default: 100)",
+    )
+
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
     # Retry configuration